@@ -0,0 +1,192 @@
+"""Reproducible consistency checks for the MVP fast paths.
+
+Each check compares a fast or closed-form result against the straightforward
+computation it replaces and returns ``(ok, lines)``, where ``lines`` is a
+short human-readable report. Run all checks with ``python -m src.consistency``;
+the exit status is non-zero if any check fails.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import List, Tuple
+
+from . import mvp_model
+from . import priors
+from . import scan
+
+
+def check_feasibility_boundary(
+    *,
+    n_phi: int = 80,
+    n_m: int = 400,
+    dAs_frac: float = 0.3,
+    dns_abs: float = 0.02,
+    rel_tol: float = 1e-12,
+) -> Tuple[bool, List[str]]:
+    """Compare :func:`scan.feasibility_boundary` against :func:`scan.coarse_grid`.
+
+    Both use the same ``phi_star`` rows. Every valid grid mass must fall inside
+    its row's band, and every grid mass strictly inside a band (beyond
+    ``rel_tol`` of either edge) must be valid. Rows without a band must have
+    no valid grid points.
+    """
+
+    target_kwargs = dict(dAs_frac=dAs_frac, dns_abs=dns_abs)
+    grid = scan.coarse_grid(n_phi=n_phi, n_m=n_m, **target_kwargs)
+    bands = {
+        band.phi_star: band
+        for band in scan.feasibility_boundary(n_phi=n_phi, **target_kwargs)
+    }
+
+    mismatches = 0
+    for phi_star, m, valid in zip(grid.phi_star, grid.m, grid.valid):
+        band = bands.get(phi_star)
+        if band is None:
+            mismatches += valid
+            continue
+        inside = band.m_min * (1.0 + rel_tol) <= m <= band.m_max * (1.0 - rel_tol)
+        outside = m < band.m_min * (1.0 - rel_tol) or m > band.m_max * (1.0 + rel_tol)
+        mismatches += (inside and not valid) or (outside and valid)
+
+    ok = mismatches == 0
+    return ok, [
+        f"feasibility_boundary vs coarse_grid ({n_phi}x{n_m}): "
+        f"{len(bands)} bands, {sum(grid.valid)} valid grid points, "
+        f"{mismatches} mismatches",
+    ]
+
+
+def check_inverses(
+    *,
+    n_phi: int = 50,
+    mpl: float = 1.3,
+    rel_tol: float = 1e-12,
+) -> Tuple[bool, List[str]]:
+    """Round-trip the closed-form inverses in :mod:`mvp_model` over a grid.
+
+    ``phi_star_from_ns``, ``phi_star_from_e_folds`` and ``m_from_As`` must
+    recover their inputs to ``rel_tol``. ``phi_star_from_e_folds`` must also
+    raise ``ValueError`` just below N(phi_star=0) = -phi_end^2 / (4 mpl^2).
+    """
+
+    worst = 0.0
+    phi_stars = [mpl * (2.0 + 23.0 * i / (n_phi - 1)) for i in range(n_phi)]
+    for phi_star in phi_stars:
+        for m in (1e-7, 6e-6, 1e-4):
+            recovered = (
+                (mvp_model.phi_star_from_ns(mvp_model.ns(phi_star, mpl), mpl), phi_star),
+                (mvp_model.phi_star_from_e_folds(mvp_model.e_folds(phi_star, mpl), mpl), phi_star),
+                (mvp_model.m_from_As(mvp_model.As(phi_star, m, mpl), phi_star, mpl), m),
+            )
+            worst = max(worst, *(abs(got / want - 1.0) for got, want in recovered))
+
+    N_floor = -mvp_model.phi_end(mpl) ** 2 / (4.0 * mpl ** 2)
+    try:
+        mvp_model.phi_star_from_e_folds(N_floor * (1.0 + 1e-9), mpl)
+        raises = False
+    except ValueError:
+        raises = True
+
+    ok = worst <= rel_tol and raises
+    return ok, [
+        f"inverse round trips ({n_phi} phi_star values, mpl={mpl}): "
+        f"max rel error {worst:.2e}",
+        f"phi_star_from_e_folds below N={N_floor:.4g} raises ValueError: {raises}",
+    ]
+
+
+def _exact_p1(
+    *,
+    phi_range: Tuple[float, float],
+    m_range: Tuple[float, float],
+    N_range: Tuple[float, float],
+    mpl: float,
+) -> float:
+    """Closed-form P(valid) under P1 with the default target and no r bound.
+
+    At fixed ``phi_star`` the valid masses span ``log(As_max / As_min) / 2`` in
+    log m, independent of ``phi_star``, so P1 factorises into the valid
+    ``phi_star`` fraction times that log-width over the log-m range. This holds
+    while the band stays inside ``m_range``; otherwise ``ValueError`` is raised.
+    """
+
+    As_min, As_max, ns_min, ns_max = mvp_model.target_bounds()
+    phi_lo = max(
+        phi_range[0],
+        mvp_model.phi_star_from_e_folds(N_range[0], mpl),
+        mvp_model.phi_star_from_ns(ns_min, mpl),
+    )
+    phi_hi = min(
+        phi_range[1],
+        mvp_model.phi_star_from_e_folds(N_range[1], mpl),
+        mvp_model.phi_star_from_ns(ns_max, mpl),
+    )
+    if not (
+        m_range[0] <= mvp_model.m_from_As(As_min, phi_hi, mpl)
+        and mvp_model.m_from_As(As_max, phi_lo, mpl) <= m_range[1]
+    ):
+        raise ValueError("valid mass band leaves m_range; P1 has no closed form")
+
+    phi_fraction = max(0.0, phi_hi - phi_lo) / (phi_range[1] - phi_range[0])
+    m_fraction = 0.5 * math.log(As_max / As_min) / math.log(m_range[1] / m_range[0])
+    return phi_fraction * m_fraction
+
+
+def check_importance_sampling(
+    *,
+    n_plain: int = 200000,
+    n_importance: int = 20000,
+    seed: int = 0,
+    n_sigma: float = 4.0,
+    rel_tol: float = 0.15,
+) -> Tuple[bool, List[str]]:
+    """Compare ``estimate_priors(importance=True)`` with plain Monte Carlo.
+
+    Uses the default priors and target with no r bound. P1 must match its
+    closed form (:func:`_exact_p1`) to ``rel_tol`` with importance sampling,
+    and to ``n_sigma`` binomial standard errors without it. For P1 and P2, the
+    importance estimate must lie within ``n_sigma`` binomial standard errors of
+    the plain one. P3 is reported but not tested. Its plain estimate is carried
+    by a handful of exp(3N) weights, so it has no useful error bar.
+    """
+
+    plain = priors.estimate_priors(n_samples=n_plain, seed=seed)
+    weighted = priors.estimate_priors(n_samples=n_importance, seed=seed, importance=True)
+    exact = _exact_p1(
+        phi_range=priors.PHI_RANGE_DEFAULT,
+        m_range=priors.M_RANGE_DEFAULT,
+        N_range=priors.N_RANGE_DEFAULT,
+        mpl=1.0,
+    )
+
+    ok = abs(weighted[0].p_valid / exact - 1.0) <= rel_tol
+    ok = ok and abs(plain[0].p_valid - exact) <= n_sigma * math.sqrt(exact / n_plain)
+    lines = [f"P1 closed form: {exact:.4g}"]
+    for index, (plain_result, weighted_result) in enumerate(zip(plain, weighted)):
+        line = (
+            f"{plain_result.name}: plain {plain_result.p_valid:.4g} "
+            f"(n={n_plain}), importance {weighted_result.p_valid:.4g} (n={n_importance})"
+        )
+        if index < 2:
+            sigma = math.sqrt(plain_result.p_valid / n_plain)
+            agrees = abs(weighted_result.p_valid - plain_result.p_valid) <= n_sigma * sigma
+            ok = ok and agrees
+            line += f", within {n_sigma:g} sigma: {agrees}"
+        lines.append(line)
+    return ok, lines
+
+
+CHECKS = (check_feasibility_boundary, check_inverses, check_importance_sampling)
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI entrypoint
+    import sys
+
+    all_ok = True
+    for check in CHECKS:
+        ok, lines = check()
+        all_ok = all_ok and ok
+        for line in lines:
+            print(f"[{'ok' if ok else 'FAIL'}] {line}")
+    sys.exit(0 if all_ok else 1)
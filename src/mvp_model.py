@@ -9,8 +9,7 @@ reintroduce physical units (defaulting to the reduced Planck mass).
 from __future__ import annotations
 
 import math
-from dataclasses import dataclass
-from typing import Dict, Iterable, Optional, Tuple
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
 
 # Reduced Planck mass in GeV (Planck 2018 best-fit).
 MPL_REDUCED_GEV = 2.435e18
@@ -21,6 +20,7 @@ NS0 = 0.965
 DAS_FRAC = 0.02
 DNS_ABS = 0.004
 R_MAX = 0.06
+N_RANGE_DEFAULT: Tuple[float, float] = (50.0, 60.0)
 
 
 def epsilon(phi: float, mpl: float = 1.0) -> float:
@@ -57,6 +57,14 @@ def e_folds(phi_star: float, mpl: float = 1.0) -> float:
     return (phi_star ** 2 - phi_end_val ** 2) / (4.0 * mpl ** 2)
 
 
+def e_folds_batch(phi_stars: Sequence[float], mpl: float = 1.0) -> List[float]:
+    """Column-wise :func:`e_folds` with ``phi_end`` evaluated once per batch."""
+
+    phi_end_sq = phi_end(mpl) ** 2
+    N_scale = 4.0 * mpl ** 2
+    return [(phi_star ** 2 - phi_end_sq) / N_scale for phi_star in phi_stars]
+
+
 def As(phi_star: float, m: float, mpl: float = 1.0) -> float:
     """Scalar amplitude at the pivot scale."""
 
@@ -80,8 +88,37 @@ def r(phi_star: float, mpl: float = 1.0) -> float:
     return 16.0 * eps_val
 
 
-@dataclass
-class ForwardResult:
+def phi_star_from_ns(ns_val: float, mpl: float = 1.0) -> float:
+    """Invert :func:`ns`: the ``phi_star`` with ns(phi_star) = ``ns_val``.
+
+    phi_star^2 = 8 * mpl^2 / (1 - ns); returns ``inf`` for ``ns_val >= 1``.
+    """
+
+    if ns_val >= 1.0:
+        return math.inf
+    return math.sqrt(8.0 * mpl ** 2 / (1.0 - ns_val))
+
+
+def phi_star_from_e_folds(N: float, mpl: float = 1.0) -> float:
+    """Invert :func:`e_folds`: the ``phi_star`` giving ``N`` e-folds.
+
+    phi_star^2 = 4 * mpl^2 * N + phi_end^2; raises ``ValueError`` (math domain
+    error) for N < -phi_end^2 / (4 * mpl^2), which no real ``phi_star`` reaches.
+    """
+
+    return math.sqrt(4.0 * mpl ** 2 * N + phi_end(mpl) ** 2)
+
+
+def m_from_As(As_val: float, phi_star: float, mpl: float = 1.0) -> float:
+    """Invert :func:`As` in ``m`` at fixed ``phi_star``.
+
+    m = sqrt(96 * pi^2 * mpl^6 * As) / phi_star^2
+    """
+
+    return math.sqrt(96.0 * math.pi ** 2 * mpl ** 6 * As_val) / phi_star ** 2
+
+
+class ForwardResult(NamedTuple):
     As: float
     ns: float
     r: float
@@ -89,13 +126,7 @@ class ForwardResult:
     phi_end: float
 
     def as_dict(self) -> Dict[str, float]:
-        return {
-            "As": self.As,
-            "ns": self.ns,
-            "r": self.r,
-            "N": self.N,
-            "phi_end": self.phi_end,
-        }
+        return self._asdict()
 
 
 def forward(phi_star: float, m: float, mpl: float = 1.0) -> ForwardResult:
@@ -109,19 +140,101 @@ def forward(phi_star: float, m: float, mpl: float = 1.0) -> ForwardResult:
         Mass parameter in the quadratic potential.
     mpl: float, optional
         Planck mass used in the slow-roll expressions (default: 1.0).
+
+    The observables are evaluated inline from a single ``epsilon``/``eta``
+    and ``phi_end`` evaluation rather than through :func:`As`, :func:`ns`,
+    :func:`r` and :func:`e_folds`, which would each recompute them.
     """
 
+    eps_val = epsilon(phi_star, mpl)
+    eta_val = eta(phi_star, mpl)
     phi_end_val = phi_end(mpl)
+    potential = 0.5 * m ** 2 * phi_star ** 2
     result = ForwardResult(
-        As=As(phi_star, m, mpl),
-        ns=ns(phi_star, mpl),
-        r=r(phi_star, mpl),
-        N=e_folds(phi_star, mpl),
+        As=(1.0 / (24.0 * math.pi ** 2 * mpl ** 4)) * potential / eps_val,
+        ns=1.0 - 6.0 * eps_val + 2.0 * eta_val,
+        r=16.0 * eps_val,
+        N=(phi_star ** 2 - phi_end_val ** 2) / (4.0 * mpl ** 2),
         phi_end=phi_end_val,
     )
     return result
 
 
+def forward_batch(
+    phi_stars: Sequence[float], ms: Sequence[float], mpl: float = 1.0
+) -> Dict[str, List[float]]:
+    """Evaluate the forward map column-wise for paired ``phi_star``/``m`` draws.
+
+    Returns a dict of equal-length lists keyed like ``ForwardResult.as_dict``.
+    The slow-roll formulas are pre-simplified for the quadratic potential
+    (eta == epsilon = 2 mpl^2 / phi^2), giving
+
+        As = m^2 phi^4 / (96 pi^2 mpl^6),  ns = 1 - 4 epsilon,  r = 16 epsilon,
+
+    with every mpl-dependent prefactor hoisted out of the per-draw
+    expressions. Results agree with :func:`forward` up to rounding.
+    """
+
+    phi_end_val = phi_end(mpl)
+    As_coeff = 1.0 / (96.0 * math.pi ** 2 * mpl ** 6)
+    eps_coeff = 2.0 * mpl ** 2
+
+    eps_vals = [eps_coeff / phi ** 2 for phi in phi_stars]
+    return {
+        "As": [As_coeff * (m * phi ** 2) ** 2 for phi, m in zip(phi_stars, ms)],
+        "ns": [1.0 - 4.0 * eps_val for eps_val in eps_vals],
+        "r": [16.0 * eps_val for eps_val in eps_vals],
+        "N": e_folds_batch(phi_stars, mpl),
+        "phi_end": [phi_end_val] * len(eps_vals),
+    }
+
+
+def forward_row(
+    phi_star: float, ms: Sequence[float], mpl: float = 1.0
+) -> Dict[str, List[float]]:
+    """:func:`forward_batch` for one ``phi_star`` across a column of ``m`` values.
+
+    Only As depends on ``m``; ns, r, N and phi_end are evaluated once for the
+    row and repeated. Results match :func:`forward_batch` exactly.
+    """
+
+    n = len(ms)
+    phi_sq = phi_star ** 2
+    As_coeff = 1.0 / (96.0 * math.pi ** 2 * mpl ** 6)
+    ns_val, r_val, N_val, phi_end_val = row_constants(phi_star, mpl)
+    return {
+        "As": [As_coeff * (m * phi_sq) ** 2 for m in ms],
+        "ns": [ns_val] * n,
+        "r": [r_val] * n,
+        "N": [N_val] * n,
+        "phi_end": [phi_end_val] * n,
+    }
+
+
+def row_constants(phi_star: float, mpl: float = 1.0) -> Tuple[float, float, float, float]:
+    """``(ns, r, N, phi_end)`` at ``phi_star``, as repeated by :func:`forward_row`."""
+
+    eps_val = 2.0 * mpl ** 2 / phi_star ** 2
+    return 1.0 - 4.0 * eps_val, 16.0 * eps_val, e_folds(phi_star, mpl), phi_end(mpl)
+
+
+def target_bounds(
+    *,
+    As0: float = AS0,
+    ns0: float = NS0,
+    dAs_frac: float = DAS_FRAC,
+    dns_abs: float = DNS_ABS,
+) -> Tuple[float, float, float, float]:
+    """Return the target window ``(As_min, As_max, ns_min, ns_max)`` of R(T)."""
+
+    return (
+        As0 * (1.0 - dAs_frac),
+        As0 * (1.0 + dAs_frac),
+        ns0 - dns_abs,
+        ns0 + dns_abs,
+    )
+
+
 def accept_target(
     As_val: float,
     ns_val: float,
@@ -135,10 +248,9 @@ def accept_target(
 ) -> bool:
     """Predicate for the IC target region R(T)."""
 
-    As_min = As0 * (1.0 - dAs_frac)
-    As_max = As0 * (1.0 + dAs_frac)
-    ns_min = ns0 - dns_abs
-    ns_max = ns0 + dns_abs
+    As_min, As_max, ns_min, ns_max = target_bounds(
+        As0=As0, ns0=ns0, dAs_frac=dAs_frac, dns_abs=dns_abs
+    )
 
     if not (As_min <= As_val <= As_max):
         return False
@@ -154,6 +266,100 @@ def accept_target(
     return r_val <= r_max
 
 
+def _target_limits(
+    *,
+    As0: float,
+    ns0: float,
+    dAs_frac: float,
+    dns_abs: float,
+    r_max: Optional[float],
+) -> Tuple[float, float, float, float, float]:
+    """:func:`target_bounds` plus the upper bound on r for the column-wise predicates."""
+
+    As_min, As_max, ns_min, ns_max = target_bounds(
+        As0=As0, ns0=ns0, dAs_frac=dAs_frac, dns_abs=dns_abs
+    )
+    # A disabled tensor bound admits every (finite) r.
+    r_bound = math.inf if r_max is None else r_max
+    return As_min, As_max, ns_min, ns_max, r_bound
+
+
+def accept_target_row(
+    As_vals: Sequence[float],
+    ns_val: float,
+    r_val: float,
+    *,
+    As0: float = AS0,
+    ns0: float = NS0,
+    dAs_frac: float = DAS_FRAC,
+    dns_abs: float = DNS_ABS,
+    r_max: Optional[float] = R_MAX,
+) -> List[bool]:
+    """Column-wise :func:`accept_target` for draws sharing one ``ns`` and ``r`` value.
+
+    Along a fixed-``phi_star`` row (see :func:`forward_row`) only As varies, so
+    the ns and r bounds are tested once for the whole row.
+    """
+
+    if not accept_row_target(
+        ns_val, r_val, As0=As0, ns0=ns0, dAs_frac=dAs_frac, dns_abs=dns_abs, r_max=r_max
+    ):
+        return [False] * len(As_vals)
+    As_min, As_max, _, _ = target_bounds(
+        As0=As0, ns0=ns0, dAs_frac=dAs_frac, dns_abs=dns_abs
+    )
+    return [As_min <= As_val <= As_max for As_val in As_vals]
+
+
+def accept_row_target(
+    ns_val: float,
+    r_val: float,
+    *,
+    As0: float = AS0,
+    ns0: float = NS0,
+    dAs_frac: float = DAS_FRAC,
+    dns_abs: float = DNS_ABS,
+    r_max: Optional[float] = R_MAX,
+) -> bool:
+    """The As-independent part of :func:`accept_target`: the ns window and r bound."""
+
+    _, _, ns_min, ns_max, r_bound = _target_limits(
+        As0=As0, ns0=ns0, dAs_frac=dAs_frac, dns_abs=dns_abs, r_max=r_max
+    )
+    return ns_min <= ns_val <= ns_max and r_val <= r_bound
+
+
+def valid_batch(
+    columns: Dict[str, List[float]],
+    *,
+    N_range: Tuple[float, float] = N_RANGE_DEFAULT,
+    As0: float = AS0,
+    ns0: float = NS0,
+    dAs_frac: float = DAS_FRAC,
+    dns_abs: float = DNS_ABS,
+    r_max: Optional[float] = R_MAX,
+) -> List[bool]:
+    """Column-wise :func:`valid` over the output of :func:`forward_batch`.
+
+    The N-range and target-window checks are fused into a single pass over
+    the columns, testing the N range first.
+    """
+
+    N_min, N_max = N_range
+    As_min, As_max, ns_min, ns_max, r_bound = _target_limits(
+        As0=As0, ns0=ns0, dAs_frac=dAs_frac, dns_abs=dns_abs, r_max=r_max
+    )
+    rows = zip(columns["N"], columns["As"], columns["ns"], columns["r"])
+
+    return [
+        N_min <= N_val <= N_max
+        and As_min <= As_val <= As_max
+        and ns_min <= ns_val <= ns_max
+        and r_val <= r_bound
+        for N_val, As_val, ns_val, r_val in rows
+    ]
+
+
 def N_in_range(N: float, N_range: Iterable[float]) -> bool:
     """Check whether N lies within [N_min, N_max]."""
 
@@ -166,28 +372,29 @@ def valid(
     m: float,
     *,
     mpl: float = 1.0,
-    N_range: Tuple[float, float] = (50.0, 60.0),
+    N_range: Tuple[float, float] = N_RANGE_DEFAULT,
     As0: float = AS0,
     ns0: float = NS0,
     dAs_frac: float = DAS_FRAC,
     dns_abs: float = DNS_ABS,
     r_max: Optional[float] = R_MAX,
 ) -> bool:
-    """Validity predicate for a configuration C=(phi_star, m)."""
+    """Validity predicate for a configuration C=(phi_star, m).
 
-    forward_result = forward(phi_star, m, mpl)
+    N depends only on ``phi_star``, so it is checked before the observables
+    are evaluated; configurations outside ``N_range`` return early.
+    """
 
-    if not N_in_range(forward_result.N, N_range):
+    if not (N_range[0] <= e_folds(phi_star, mpl) <= N_range[1]):
         return False
 
     return accept_target(
-        forward_result.As,
-        forward_result.ns,
-        forward_result.r,
+        As(phi_star, m, mpl),
+        ns(phi_star, mpl),
+        r(phi_star, mpl),
         As0=As0,
         ns0=ns0,
         dAs_frac=dAs_frac,
         dns_abs=dns_abs,
         r_max=r_max,
     )
-
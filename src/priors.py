@@ -11,32 +11,38 @@ choice. The priors mirror the menu in ``docs/PRIORS.md``:
 Usage
 -----
 Run ``python -m src.priors`` to print a small summary table for the default
-configurations. The defaults mirror the Phase 3 scan ranges and the Phase 2
-validity predicate (tensor constraint off by default).
+configurations (``--seed`` makes runs reproducible). The defaults mirror the
+Phase 3 scan ranges and the Phase 2 validity predicate (tensor constraint off
+by default).
 """
 
 from __future__ import annotations
 
 import math
 import random
-from dataclasses import dataclass
-from typing import Callable, Dict, Iterable, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import repeat
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from . import mvp_model
 
 # Default parameter ranges (match Phase 3 scan for consistency)
 PHI_RANGE_DEFAULT: Tuple[float, float] = (6.0, 22.0)
 M_RANGE_DEFAULT: Tuple[float, float] = (5e-7, 5e-5)
-N_RANGE_DEFAULT: Tuple[float, float] = (50.0, 60.0)
+N_RANGE_DEFAULT: Tuple[float, float] = mvp_model.N_RANGE_DEFAULT
+
+# Draws per chunk; bounds the working set of the Monte Carlo estimators.
+_CHUNK_SIZE = 4096
 
 
 @dataclass
-class Sample:
-    """A single draw from a prior distribution."""
+class SampleBatch:
+    """A batch of draws from a prior distribution, stored column-wise."""
 
-    phi_star: float
-    m: float
-    weight: float = 1.0
+    phi_star: List[float]
+    m: List[float]
+    weight: List[float]
 
 
 @dataclass
@@ -67,109 +73,286 @@ class PriorResult:
         }
 
 
-def _uniform(rng: random.Random, low: float, high: float) -> float:
-    return low + (high - low) * rng.random()
+@dataclass
+class _Tally:
+    """Streaming accumulator for one prior across sample chunks.
+
+    Only per-chunk weight totals and the (rare) valid draws are retained, so
+    memory stays O(chunk + n_valid) regardless of ``n_samples``.
+    """
+
+    n_samples: int = 0
+    chunk_weight_sums: List[float] = field(default_factory=list)
+    valid_weight: List[float] = field(default_factory=list)
+    valid_phi: List[float] = field(default_factory=list)
+    valid_m: List[float] = field(default_factory=list)
+    valid_N: List[float] = field(default_factory=list)
+
+    def add(self, batch: SampleBatch, valid_idx: List[int], valid_N: List[float]) -> None:
+        self.n_samples += len(batch.weight)
+        self.chunk_weight_sums.append(math.fsum(batch.weight))
+        self.valid_weight.extend(batch.weight[i] for i in valid_idx)
+        self.valid_phi.extend(batch.phi_star[i] for i in valid_idx)
+        self.valid_m.extend(batch.m[i] for i in valid_idx)
+        self.valid_N.extend(valid_N)
+
+    def merge(self, other: "_Tally") -> None:
+        self.n_samples += other.n_samples
+        self.chunk_weight_sums.extend(other.chunk_weight_sums)
+        self.valid_weight.extend(other.valid_weight)
+        self.valid_phi.extend(other.valid_phi)
+        self.valid_m.extend(other.valid_m)
+        self.valid_N.extend(other.valid_N)
+
 
+def _uniform(rng: random.Random, low: float, high: float, n: int) -> List[float]:
+    """Draw ``n`` values uniformly over [low, high]."""
 
-def _uniform_log(rng: random.Random, low: float, high: float) -> float:
-    """Sample x with log x uniform over [log low, log high]."""
+    span = high - low
+    draw = rng.random
+    return [low + span * draw() for _ in range(n)]
+
+
+def _log_uniform_from(u: List[float], low: float, high: float) -> List[float]:
+    """Map unit draws ``u`` to values with log x uniform over [log low, log high]."""
 
     log_low = math.log(low)
-    log_high = math.log(high)
-    return math.exp(_uniform(rng, log_low, log_high))
+    log_span = math.log(high) - log_low
+    return [math.exp(log_low + log_span * u_val) for u_val in u]
 
 
 def _sample_p1(
-    rng: random.Random,
-    phi_range: Tuple[float, float],
+    phi_star: List[float],
+    u: List[float],
     m_range: Tuple[float, float],
-) -> Sample:
-    phi_star = _uniform(rng, *phi_range)
-    m = _uniform_log(rng, *m_range)
-    return Sample(phi_star=phi_star, m=m, weight=1.0)
+) -> SampleBatch:
+    """Flat in phi_star, flat in log m, from unit draws ``u``."""
 
+    m = _log_uniform_from(u, *m_range)
+    return SampleBatch(phi_star=phi_star, m=m, weight=[1.0] * len(m))
 
-def _sample_p2(
-    rng: random.Random,
+
+def _potential_bounds(
     phi_range: Tuple[float, float],
     m_range: Tuple[float, float],
-) -> Sample:
-    """Flat in phi_star, flat in log V_star with V_star = 1/2 m^2 phi_star^2.
+) -> Tuple[float, float]:
+    """Support [V_min, V_max] of the P2 log V_star prior.
 
     The V range is chosen so that the derived ``m`` remains within ``m_range``
     for any phi_star in ``phi_range``.
     """
 
-    phi_star = _uniform(rng, *phi_range)
-
     phi_min, phi_max = phi_range
     m_min, m_max = m_range
     V_min = 0.5 * (m_min ** 2) * (phi_max ** 2)
     V_max = 0.5 * (m_max ** 2) * (phi_min ** 2)
+    return V_min, V_max
 
-    V_star = _uniform_log(rng, V_min, V_max)
-    m = math.sqrt(2.0 * V_star) / phi_star
-    return Sample(phi_star=phi_star, m=m, weight=1.0)
 
+def _sample_p2(
+    phi_star: List[float],
+    u: List[float],
+    V_range: Tuple[float, float],
+) -> SampleBatch:
+    """Flat in phi_star, flat in log V_star with V_star = 1/2 m^2 phi_star^2.
 
-def _sample_p3(
-    rng: random.Random,
+    ``V_range`` is the log V_star support, see :func:`_potential_bounds`;
+    ``u`` are the unit draws that set log V_star.
+    """
+
+    V_star = _log_uniform_from(u, *V_range)
+    m = [math.sqrt(2.0 * V) / phi for phi, V in zip(phi_star, V_star)]
+    return SampleBatch(phi_star=phi_star, m=m, weight=[1.0] * len(m))
+
+
+def _valid_region_box(
     phi_range: Tuple[float, float],
     m_range: Tuple[float, float],
+    validity_configs: List[Dict[str, Any]],
     *,
     mpl: float,
-) -> Sample:
-    """Volume-weighted proxy using weight w = exp(3N(phi_star))."""
+) -> Optional[Tuple[Tuple[float, float], Tuple[float, float]]]:
+    """Bounding box ``(phi_box, m_box)`` of the valid region within the P1 support.
+
+    The quadratic forward map inverts in closed form: the ns window and
+    ``N_range`` bound phi_star, and the As window then bounds m at the phi_star
+    extremes. The box covers the valid region of every entry of
+    ``validity_configs`` (the tensor bound only shrinks it); ``None`` means no
+    configuration has a valid region inside the support.
+    """
+
+    phi_boxes = []
+    m_boxes = []
+    for cfg in validity_configs:
+        As_min, As_max, ns_min, ns_max = mvp_model.target_bounds(
+            As0=cfg["As0"], ns0=cfg["ns0"], dAs_frac=cfg["dAs_frac"], dns_abs=cfg["dns_abs"]
+        )
+        N_min, N_max = cfg["N_range"]
+        phi_lo = max(
+            phi_range[0],
+            mvp_model.phi_star_from_ns(ns_min, mpl),
+            mvp_model.phi_star_from_e_folds(max(N_min, 0.0), mpl),
+        )
+        phi_hi = min(
+            phi_range[1],
+            mvp_model.phi_star_from_ns(ns_max, mpl),
+            mvp_model.phi_star_from_e_folds(max(N_max, 0.0), mpl),
+        )
+        if not phi_lo < phi_hi:
+            continue
+
+        m_lo = max(m_range[0], mvp_model.m_from_As(As_min, phi_hi, mpl))
+        m_hi = min(m_range[1], mvp_model.m_from_As(As_max, phi_lo, mpl))
+        if not m_lo < m_hi:
+            continue
+
+        phi_boxes.append((phi_lo, phi_hi))
+        m_boxes.append((m_lo, m_hi))
+
+    if not phi_boxes:
+        return None
 
-    base_sample = _sample_p1(rng, phi_range, m_range)
-    N_val = mvp_model.e_folds(base_sample.phi_star, mpl)
-    weight = math.exp(3.0 * N_val)
-    return Sample(phi_star=base_sample.phi_star, m=base_sample.m, weight=weight)
+    phi_box = (min(lo for lo, _ in phi_boxes), max(hi for _, hi in phi_boxes))
+    m_box = (min(lo for lo, _ in m_boxes), max(hi for _, hi in m_boxes))
+    return phi_box, m_box
 
 
-def _estimate_prior(
+def _sample_importance(
+    rng: random.Random,
+    phi_range: Tuple[float, float],
+    m_range: Tuple[float, float],
+    V_range: Tuple[float, float],
+    box: Tuple[Tuple[float, float], Tuple[float, float]],
+    n: int,
+) -> Tuple[SampleBatch, SampleBatch]:
+    """Importance-sample P1 and P2 from a defensive mixture proposal.
+
+    Half of the draws follow P1 and half are flat in (phi_star, log m) over
+    ``box`` (see :func:`_valid_region_box`). Both returned batches share the
+    draws and carry the weights p/q of P1 and P2 against the mixture density
+    q. The P1 component keeps q > 0 on the whole support, so the
+    self-normalised estimators of :func:`_summarize` stay consistent.
+    """
+
+    (phi_box_lo, phi_box_hi), (m_box_lo, m_box_hi) = box
+    n_box = n // 2
+    n_prior = n - n_box
+
+    phi_star = _uniform(rng, *phi_range, n_prior) + _uniform(rng, phi_box_lo, phi_box_hi, n_box)
+    m = _log_uniform_from(_uniform(rng, 0.0, 1.0, n_prior), *m_range) + _log_uniform_from(
+        _uniform(rng, 0.0, 1.0, n_box), m_box_lo, m_box_hi
+    )
+
+    # Densities in (phi_star, log m) are flat over the P1 support and the box,
+    # so p1/q takes one value inside the box and another outside it.
+    log_m_span = math.log(m_range[1] / m_range[0])
+    support_area = (phi_range[1] - phi_range[0]) * log_m_span
+    box_area = (phi_box_hi - phi_box_lo) * math.log(m_box_hi / m_box_lo)
+    prior_frac = n_prior / n
+    w_in_box = 1.0 / (prior_frac + (1.0 - prior_frac) * support_area / box_area)
+    w_outside = 1.0 / prior_frac
+    p1_weight = [
+        w_in_box
+        if phi_box_lo <= phi <= phi_box_hi and m_box_lo <= m_val <= m_box_hi
+        else w_outside
+        for phi, m_val in zip(phi_star, m)
+    ]
+
+    # P2 is flat in (phi_star, log V_star) with d log V_star = 2 d log m.
+    V_min, V_max = V_range
+    p2_scale = 2.0 * log_m_span / math.log(V_max / V_min)
+    p2_weight = [
+        w * p2_scale if V_min <= 0.5 * (m_val * phi) ** 2 <= V_max else 0.0
+        for w, phi, m_val in zip(p1_weight, phi_star, m)
+    ]
+
+    return (
+        SampleBatch(phi_star=phi_star, m=m, weight=p1_weight),
+        SampleBatch(phi_star=phi_star, m=m, weight=p2_weight),
+    )
+
+
+def _volume_weighted(batch: SampleBatch, N_vals: List[float]) -> SampleBatch:
+    """Volume-weighted proxy: reweight ``batch`` by w = exp(3N(phi_star)).
+
+    ``N_vals`` are the e-folds of ``batch.phi_star`` (see
+    :func:`mvp_model.e_folds_batch`).
+    """
+
+    weight = [w * math.exp(3.0 * N_val) for w, N_val in zip(batch.weight, N_vals)]
+    return SampleBatch(phi_star=batch.phi_star, m=batch.m, weight=weight)
+
+
+def _forward_in_range(
+    batch: SampleBatch,
+    N_vals: List[float],
     *,
-    name: str,
-    sampler: Callable[[random.Random], Sample],
-    n_samples: int,
     mpl: float,
     N_range: Tuple[float, float],
+) -> Tuple[List[int], Dict[str, List[float]]]:
+    """Evaluate the forward map for the draws in ``batch`` with N in ``N_range``.
+
+    ``N_vals`` are the e-folds of ``batch.phi_star``. Returns the indices of
+    the draws in range and their :func:`mvp_model.forward_batch` columns. N
+    depends only on phi_star, so draws outside ``N_range`` are rejected before
+    the remaining observables are evaluated.
+    """
+
+    phi_vals = batch.phi_star
+    m_vals = batch.m
+
+    N_min, N_max = N_range
+    in_N_idx = [i for i, N_val in enumerate(N_vals) if N_min <= N_val <= N_max]
+    columns = mvp_model.forward_batch(
+        [phi_vals[i] for i in in_N_idx], [m_vals[i] for i in in_N_idx], mpl
+    )
+    return in_N_idx, columns
+
+
+def _select_valid(
+    candidates: Tuple[List[int], Dict[str, List[float]]],
+    *,
+    N_range: Tuple[float, float],
     As0: float,
     ns0: float,
     dAs_frac: float,
     dns_abs: float,
     r_max: float | None,
-) -> PriorResult:
-    rng = random.Random()
-    n_valid = 0
-    weight_sum = 0.0
-    weight_sum_valid = 0.0
-    sum_phi = 0.0
-    sum_m = 0.0
-    sum_N = 0.0
-
-    for _ in range(n_samples):
-        sample = sampler(rng)
-        forward_result = mvp_model.forward(sample.phi_star, sample.m, mpl)
-        is_valid = mvp_model.valid(
-            sample.phi_star,
-            sample.m,
-            mpl=mpl,
-            N_range=N_range,
-            As0=As0,
-            ns0=ns0,
-            dAs_frac=dAs_frac,
-            dns_abs=dns_abs,
-            r_max=r_max,
-        )
+) -> Tuple[List[int], List[float]]:
+    """Return the batch indices of the valid ``candidates`` and their N values.
 
-        weight_sum += sample.weight
-        if is_valid:
-            n_valid += 1
-            weight_sum_valid += sample.weight
-            sum_phi += sample.weight * sample.phi_star
-            sum_m += sample.weight * sample.m
-            sum_N += sample.weight * forward_result.N
+    ``candidates`` is the output of :func:`_forward_in_range`; its N range
+    must cover ``N_range``.
+    """
+
+    in_N_idx, columns = candidates
+    is_valid = mvp_model.valid_batch(
+        columns,
+        N_range=N_range,
+        As0=As0,
+        ns0=ns0,
+        dAs_frac=dAs_frac,
+        dns_abs=dns_abs,
+        r_max=r_max,
+    )
+    valid_rows = [row for row, ok in enumerate(is_valid) if ok]
+    valid_idx = [in_N_idx[row] for row in valid_rows]
+    valid_N = [columns["N"][row] for row in valid_rows]
+    return valid_idx, valid_N
+
+
+def _summarize(name: str, tally: _Tally) -> PriorResult:
+    """Reduce the accumulated draws of one prior to a :class:`PriorResult`."""
+
+    weights = tally.valid_weight
+
+    # P3 weights span ~150 orders of magnitude; use exactly rounded sums.
+    n_valid = len(weights)
+    weight_sum = math.fsum(tally.chunk_weight_sums)
+    weight_sum_valid = math.fsum(weights)
+    sum_phi = math.fsum(w * phi for w, phi in zip(weights, tally.valid_phi))
+    sum_m = math.fsum(w * m for w, m in zip(weights, tally.valid_m))
+    sum_N = math.fsum(w * N_val for w, N_val in zip(weights, tally.valid_N))
 
     p_valid = weight_sum_valid / weight_sum if weight_sum > 0 else 0.0
 
@@ -179,7 +362,7 @@ def _estimate_prior(
 
     return PriorResult(
         name=name,
-        n_samples=n_samples,
+        n_samples=tally.n_samples,
         n_valid=n_valid,
         weight_sum=weight_sum,
         weight_sum_valid=weight_sum_valid,
@@ -190,6 +373,134 @@ def _estimate_prior(
     )
 
 
+def _estimate_chunk(
+    chunk_seed: int,
+    n: int,
+    phi_range: Tuple[float, float],
+    m_range: Tuple[float, float],
+    V_range: Tuple[float, float],
+    mpl: float,
+    validity_configs: List[Dict[str, Any]],
+    box: Optional[Tuple[Tuple[float, float], Tuple[float, float]]],
+) -> List[Tuple[_Tally, _Tally, _Tally]]:
+    """Draw and evaluate one chunk of ``n`` samples for P1, P2 and P3.
+
+    The draws and forward-map columns are shared by every entry of
+    ``validity_configs``; one (P1, P2, P3) tally triple is returned per entry.
+    With a ``box`` the draws are importance-sampled, see
+    :func:`_sample_importance`.
+    """
+
+    rng = random.Random(chunk_seed)
+    if box is not None:
+        p1_batch, p2_batch = _sample_importance(rng, phi_range, m_range, V_range, box, n)
+    else:
+        # Common random numbers: P1 and P2 share the phi_star draws and the
+        # unit draws that set log m (P1) or log V_star (P2).
+        phi_star = _uniform(rng, *phi_range, n)
+        u = _uniform(rng, 0.0, 1.0, n)
+        p1_batch = _sample_p1(phi_star, u, m_range)
+        p2_batch = _sample_p2(phi_star, u, V_range)
+
+    # P1 and P2 share their phi_star draws, so one N column serves the N
+    # pre-filter of both and the P3 volume weights.
+    N_vals = mvp_model.e_folds_batch(p1_batch.phi_star, mpl)
+    p3_batch = _volume_weighted(p1_batch, N_vals)
+
+    # Evaluate the forward map once over the union of the configs' N ranges.
+    N_hull = (
+        min(cfg["N_range"][0] for cfg in validity_configs),
+        max(cfg["N_range"][1] for cfg in validity_configs),
+    )
+    p1_candidates = _forward_in_range(p1_batch, N_vals, mpl=mpl, N_range=N_hull)
+    # Importance draws give P1 and P2 the same (phi_star, m) points, so only
+    # the plain CRN draws need a second forward evaluation.
+    p2_candidates = (
+        p1_candidates
+        if box is not None
+        else _forward_in_range(p2_batch, N_vals, mpl=mpl, N_range=N_hull)
+    )
+
+    tallies = []
+    for cfg in validity_configs:
+        p1_tally, p2_tally, p3_tally = _Tally(), _Tally(), _Tally()
+        p1_valid = _select_valid(p1_candidates, **cfg)
+        p2_valid = (
+            p1_valid if box is not None else _select_valid(p2_candidates, **cfg)
+        )
+        p1_tally.add(p1_batch, *p1_valid)
+        p2_tally.add(p2_batch, *p2_valid)
+        p3_tally.add(p3_batch, *p1_valid)
+        tallies.append((p1_tally, p2_tally, p3_tally))
+    return tallies
+
+
+def _estimate_priors_for(
+    validity_configs: List[Dict[str, Any]],
+    *,
+    n_samples: int,
+    phi_range: Tuple[float, float],
+    m_range: Tuple[float, float],
+    mpl: float,
+    seed: Optional[int],
+    n_workers: int,
+    importance: bool,
+) -> List[Tuple[PriorResult, PriorResult, PriorResult]]:
+    """Run :func:`estimate_priors` for several validity configs on shared draws.
+
+    Each entry of ``validity_configs`` holds the ``N_range``, ``As0``, ``ns0``,
+    ``dAs_frac``, ``dns_abs`` and ``r_max`` keywords of :func:`estimate_priors`.
+    The draws and forward-map evaluations are made once and reused for every
+    config, which only changes the (cheap) validity predicate.
+    """
+
+    V_range = _potential_bounds(phi_range, m_range)
+    box = (
+        _valid_region_box(phi_range, m_range, validity_configs, mpl=mpl)
+        if importance
+        else None
+    )
+
+    rng = random.Random(seed)
+    chunk_sizes = [
+        min(_CHUNK_SIZE, n_samples - start) for start in range(0, n_samples, _CHUNK_SIZE)
+    ]
+    chunk_seeds = [rng.getrandbits(64) for _ in chunk_sizes]
+    chunk_args = (
+        chunk_seeds,
+        chunk_sizes,
+        repeat(phi_range),
+        repeat(m_range),
+        repeat(V_range),
+        repeat(mpl),
+        repeat(validity_configs),
+        repeat(box),
+    )
+    if n_workers > 1:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            chunk_tallies = list(executor.map(_estimate_chunk, *chunk_args))
+    else:
+        chunk_tallies = list(map(_estimate_chunk, *chunk_args))
+
+    results = []
+    for cfg_index in range(len(validity_configs)):
+        p1_tally, p2_tally, p3_tally = _Tally(), _Tally(), _Tally()
+        for chunk in chunk_tallies:
+            chunk_p1, chunk_p2, chunk_p3 = chunk[cfg_index]
+            p1_tally.merge(chunk_p1)
+            p2_tally.merge(chunk_p2)
+            p3_tally.merge(chunk_p3)
+
+        results.append(
+            (
+                _summarize("P1_flat_phi_log_m", p1_tally),
+                _summarize("P2_flat_phi_log_V", p2_tally),
+                _summarize("P3_volume_weighted", p3_tally),
+            )
+        )
+    return results
+
+
 def estimate_priors(
     *,
     n_samples: int = 20000,
@@ -202,21 +513,30 @@ def estimate_priors(
     dAs_frac: float = mvp_model.DAS_FRAC,
     dns_abs: float = mvp_model.DNS_ABS,
     r_max: float | None = None,
+    seed: Optional[int] = None,
+    n_workers: int = 1,
+    importance: bool = False,
 ) -> Tuple[PriorResult, PriorResult, PriorResult]:
-    """Estimate P(valid) for the three default priors via Monte Carlo."""
-
-    def p1_sampler(rng: random.Random) -> Sample:
-        return _sample_p1(rng, phi_range, m_range)
-
-    def p2_sampler(rng: random.Random) -> Sample:
-        return _sample_p2(rng, phi_range, m_range)
-
-    def p3_sampler(rng: random.Random) -> Sample:
-        return _sample_p3(rng, phi_range, m_range, mpl=mpl)
+    """Estimate P(valid) for the three default priors via Monte Carlo.
+
+    P3 reweights the P1 draws rather than drawing its own, so the two share
+    a single forward-map and validity evaluation. P1 and P2 are driven by the
+    same uniform draws (common random numbers), which reduces the variance of
+    comparisons between priors.
+
+    Draws are processed in chunks with streaming accumulators; pass ``seed``
+    for reproducible runs. Each chunk gets its own seed derived from ``seed``,
+    so chunks can be spread over ``n_workers`` processes without changing the
+    result.
+
+    With ``importance=True`` half of the draws are concentrated on a box
+    around the valid region and all three priors are estimated by importance
+    weighting (see :func:`_sample_importance`), which sharply reduces the
+    variance of the rare-event estimates; ``n_valid`` then counts valid
+    proposal draws rather than prior draws.
+    """
 
-    common_kwargs = dict(
-        n_samples=n_samples,
-        mpl=mpl,
+    validity_config = dict(
         N_range=N_range,
         As0=As0,
         ns0=ns0,
@@ -224,11 +544,17 @@ def estimate_priors(
         dns_abs=dns_abs,
         r_max=r_max,
     )
-
-    p1 = _estimate_prior(name="P1_flat_phi_log_m", sampler=p1_sampler, **common_kwargs)
-    p2 = _estimate_prior(name="P2_flat_phi_log_V", sampler=p2_sampler, **common_kwargs)
-    p3 = _estimate_prior(name="P3_volume_weighted", sampler=p3_sampler, **common_kwargs)
-    return p1, p2, p3
+    (results,) = _estimate_priors_for(
+        [validity_config],
+        n_samples=n_samples,
+        phi_range=phi_range,
+        m_range=m_range,
+        mpl=mpl,
+        seed=seed,
+        n_workers=n_workers,
+        importance=importance,
+    )
+    return results
 
 
 def _format_result(result: PriorResult) -> str:
@@ -260,6 +586,9 @@ def run_summary(  # pragma: no cover - convenience CLI
     dAs_frac: float = mvp_model.DAS_FRAC,
     dns_abs: float = mvp_model.DNS_ABS,
     r_max: float | None = None,
+    seed: Optional[int] = None,
+    n_workers: int = 1,
+    importance: bool = False,
 ) -> Iterable[str]:
     """Yield human-readable summary lines for the three priors."""
 
@@ -274,6 +603,9 @@ def run_summary(  # pragma: no cover - convenience CLI
         dAs_frac=dAs_frac,
         dns_abs=dns_abs,
         r_max=r_max,
+        seed=seed,
+        n_workers=n_workers,
+        importance=importance,
     )
     for result in results:
         yield _format_result(result)
@@ -285,6 +617,9 @@ def run_sensitivity(  # pragma: no cover - convenience CLI
     phi_range: Tuple[float, float] = PHI_RANGE_DEFAULT,
     m_range: Tuple[float, float] = M_RANGE_DEFAULT,
     mpl: float = 1.0,
+    seed: Optional[int] = None,
+    n_workers: int = 1,
+    importance: bool = False,
 ) -> Iterable[str]:
     """Yield summary lines for a small set of sensitivity variants.
 
@@ -292,6 +627,8 @@ def run_sensitivity(  # pragma: no cover - convenience CLI
     - Tensor bound on vs. off
     - Wider N range
     - Narrower and wider tolerance bands
+
+    All variants are evaluated on the same draws and forward-map columns.
     """
 
     configs = [
@@ -314,19 +651,29 @@ def run_sensitivity(  # pragma: no cover - convenience CLI
         ),
     ]
 
-    for cfg in configs:
-        results = estimate_priors(
-            n_samples=n_samples,
-            phi_range=phi_range,
-            m_range=m_range,
+    validity_configs = [
+        dict(
             N_range=cfg.get("N_range", N_RANGE_DEFAULT),
-            mpl=mpl,
             As0=cfg.get("As0", mvp_model.AS0),
             ns0=cfg.get("ns0", mvp_model.NS0),
             dAs_frac=cfg.get("dAs_frac", mvp_model.DAS_FRAC),
             dns_abs=cfg.get("dns_abs", mvp_model.DNS_ABS),
             r_max=cfg.get("r_max", None),
         )
+        for cfg in configs
+    ]
+    all_results = _estimate_priors_for(
+        validity_configs,
+        n_samples=n_samples,
+        phi_range=phi_range,
+        m_range=m_range,
+        mpl=mpl,
+        seed=seed,
+        n_workers=n_workers,
+        importance=importance,
+    )
+
+    for cfg, results in zip(configs, all_results):
         header = f"[{cfg['name']}]"
         yield header
         for result in results:
@@ -342,8 +689,18 @@ if __name__ == "__main__":  # pragma: no cover - CLI entrypoint
     parser.add_argument(
         "--sensitivity", action="store_true", help="Run tensor/N/tolerance variants",
     )
+    parser.add_argument("--seed", type=int, default=None, help="Random seed")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes")
+    parser.add_argument(
+        "--importance", action="store_true", help="Importance-sample the valid region",
+    )
     args = parser.parse_args()
 
     runner = run_sensitivity if args.sensitivity else run_summary
-    for line in runner(n_samples=args.n_samples):
+    for line in runner(
+        n_samples=args.n_samples,
+        seed=args.seed,
+        n_workers=args.workers,
+        importance=args.importance,
+    ):
         print(line)
@@ -10,15 +10,62 @@ from __future__ import annotations
 
 import math
 import os
-from dataclasses import dataclass
-from typing import Iterable, List, Sequence, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, fields
+from itertools import compress, islice, repeat
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Tuple, Union
 
 from . import mvp_model
 
 
 PHI_RANGE_DEFAULT: Tuple[float, float] = (6.0, 22.0)
 M_RANGE_DEFAULT: Tuple[float, float] = (5e-7, 5e-5)
-N_RANGE_DEFAULT: Tuple[float, float] = (50.0, 60.0)
+N_RANGE_DEFAULT: Tuple[float, float] = mvp_model.N_RANGE_DEFAULT
+
+# Grids below this many points are scanned serially even with n_workers > 1.
+_MIN_PARALLEL_POINTS = 10_000
+
+# Scatter markers joined per file write; bounds the SVG text held in memory.
+_SVG_MARKER_BLOCK = 4096
+
+# Canvas geometry (pixels) shared by the phase 3 figures.
+_SVG_WIDTH, _SVG_HEIGHT, _SVG_PAD = 800, 550, 60
+_SVG_PLOT_W = _SVG_WIDTH - 2 * _SVG_PAD
+_SVG_PLOT_H = _SVG_HEIGHT - 2 * _SVG_PAD
+
+# Invariant SVG markup, pre-formatted with the canvas geometry; the remaining
+# ``{title}``/``{x_label}``/``{y_label}`` fields are filled per figure.
+_SVG_HEADER = (
+    "<?xml version='1.0' encoding='UTF-8'?>\n"
+    f"<svg xmlns='http://www.w3.org/2000/svg' width='{_SVG_WIDTH}' height='{_SVG_HEIGHT}' aria-label='{{title}}'>\n"
+    "  <title>{title}</title>\n"
+    "  <style>text{{font-family:Arial,sans-serif;font-size:14px}}</style>\n"
+    f"  <rect x='{_SVG_PAD}' y='{_SVG_PAD}' width='{_SVG_PLOT_W}' height='{_SVG_PLOT_H}' fill='none' stroke='black' stroke-width='1' />\n"
+)
+_SVG_AXIS_LABELS = (
+    f"  <text x='{_SVG_WIDTH/2:.1f}' y='{_SVG_HEIGHT - 15}' text-anchor='middle'>{{x_label}}</text>\n"
+    f"  <text x='20' y='{_SVG_HEIGHT/2:.1f}' text-anchor='middle' transform='rotate(-90, 20, {_SVG_HEIGHT/2:.1f})'>{{y_label}}</text>\n"
+)
+_SVG_FOOTER = "</svg>\n"
+# One r=3 scatter marker as two arcs, from its left edge; %-formatting is
+# measurably cheaper than an f-string in the per-point loop.
+_SVG_MARKER = "M%.2f %.2fa3 3 0 1 0 6 0a3 3 0 1 0-6 0"
+
+
+def _linspace(start: float, stop: float, num: int) -> List[float]:
+    """Generate linearly spaced values between ``start`` and ``stop``.
+
+    Returns no values for ``num <= 0`` and ``[start]`` for ``num == 1``.
+    """
+
+    if num <= 0:
+        return []
+    if num == 1:
+        return [start]
+
+    span = stop - start
+    last = num - 1
+    return [start + i * span / last for i in range(num)]
 
 
 def _logspace(start: float, stop: float, num: int) -> List[float]:
@@ -70,17 +117,8 @@ class ScanPoint:
             dns_abs=dns_abs,
             r_max=r_max,
         )
-        valid = mvp_model.valid(
-            phi_star,
-            m,
-            mpl=mpl,
-            N_range=N_range,
-            As0=As0,
-            ns0=ns0,
-            dAs_frac=dAs_frac,
-            dns_abs=dns_abs,
-            r_max=r_max,
-        )
+        # valid(C) is the target predicate plus the N range.
+        valid = accept and mvp_model.N_in_range(forward.N, N_range)
         return cls(
             phi_star=phi_star,
             m=m,
@@ -94,6 +132,109 @@ class ScanPoint:
         )
 
 
+# ScanTable has one column per ScanPoint field, in the same order.
+_SCAN_FIELDS: Tuple[str, ...] = tuple(f.name for f in fields(ScanPoint))
+
+
+def _point_values(point: ScanPoint) -> Tuple[Any, ...]:
+    """Field values of ``point`` in :class:`ScanTable` column order."""
+
+    return tuple(getattr(point, name) for name in _SCAN_FIELDS)
+
+
+@dataclass
+class ScanTable:
+    """Scan results stored column-wise, one list per :class:`ScanPoint` field.
+
+    Iterating or indexing yields ``ScanPoint`` rows (slicing yields a
+    ``ScanTable``), so the table can stand in for a ``List[ScanPoint]``; hot
+    paths should read the columns directly.
+    """
+
+    phi_star: List[float] = field(default_factory=list)
+    m: List[float] = field(default_factory=list)
+    As: List[float] = field(default_factory=list)
+    ns: List[float] = field(default_factory=list)
+    r: List[float] = field(default_factory=list)
+    N: List[float] = field(default_factory=list)
+    phi_end: List[float] = field(default_factory=list)
+    accept: List[bool] = field(default_factory=list)
+    valid: List[bool] = field(default_factory=list)
+
+    @classmethod
+    def from_points(cls, points: Iterable[ScanPoint]) -> "ScanTable":
+        """Build a table from ``ScanPoint`` rows."""
+
+        table = cls()
+        columns = table._columns()
+        for point in points:
+            for column, value in zip(columns, _point_values(point)):
+                column.append(value)
+        return table
+
+    def _columns(self) -> Tuple[List[Any], ...]:
+        return tuple(getattr(self, name) for name in _SCAN_FIELDS)
+
+    def __len__(self) -> int:
+        return len(self.phi_star)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[ScanPoint, "ScanTable"]:
+        if isinstance(index, slice):
+            return ScanTable(
+                **{name: getattr(self, name)[index] for name in _SCAN_FIELDS}
+            )
+        return ScanPoint(*(column[index] for column in self._columns()))
+
+    def __iter__(self) -> Iterator[ScanPoint]:
+        return (ScanPoint(*row) for row in zip(*self._columns()))
+
+    def extend(self, other: "ScanTable") -> None:
+        for column, other_column in zip(self._columns(), other._columns()):
+            column.extend(other_column)
+
+
+@dataclass
+class FeasibleBand:
+    """Interval ``[m_min, m_max]`` of valid masses at one ``phi_star``."""
+
+    phi_star: float
+    m_min: float
+    m_max: float
+
+
+def _scan_row(
+    phi_star: float,
+    m_vals: List[float],
+    mpl: float,
+    N_range: Tuple[float, float],
+    target_kwargs: Dict[str, Any],
+) -> ScanTable:
+    """Evaluate one ``phi_star`` row of the grid across all ``m`` values.
+
+    The row is evaluated column-wise with :func:`mvp_model.forward_row`. N, ns
+    and r are constant along the row, so their checks are made once.
+    """
+
+    columns = mvp_model.forward_row(phi_star, m_vals, mpl)
+    accept = mvp_model.accept_target_row(
+        columns["As"], columns["ns"][0], columns["r"][0], **target_kwargs
+    )
+    N_ok = mvp_model.N_in_range(columns["N"][0], N_range)
+    valid = list(accept) if N_ok else [False] * len(accept)
+
+    return ScanTable(
+        phi_star=[phi_star] * len(m_vals),
+        m=list(m_vals),
+        As=columns["As"],
+        ns=columns["ns"],
+        r=columns["r"],
+        N=columns["N"],
+        phi_end=columns["phi_end"],
+        accept=accept,
+        valid=valid,
+    )
+
+
 def coarse_grid(
     *,
     phi_range: Tuple[float, float] = PHI_RANGE_DEFAULT,
@@ -107,44 +248,112 @@ def coarse_grid(
     dAs_frac: float = mvp_model.DAS_FRAC,
     dns_abs: float = mvp_model.DNS_ABS,
     r_max: float | None = None,
-) -> List[ScanPoint]:
+    n_workers: int = 1,
+) -> ScanTable:
     """Evaluate a coarse grid over (phi_star, m).
 
     The grid samples ``phi_star`` linearly and ``m`` logarithmically to capture
     the wide dynamic range of the mass parameter while keeping runtime small.
+    With ``n_workers > 1`` the ``phi_star`` rows are evaluated in a process pool,
+    a few rows per task; grids smaller than ``_MIN_PARALLEL_POINTS`` are always
+    evaluated serially since the pool start-up would dominate.
     """
 
-    phi_vals = [
-        phi_range[0] + i * (phi_range[1] - phi_range[0]) / (n_phi - 1)
-        for i in range(n_phi)
-    ]
+    phi_vals = _linspace(phi_range[0], phi_range[1], n_phi)
     m_vals = _logspace(m_range[0], m_range[1], n_m)
 
-    results: List[ScanPoint] = []
-    for phi_star in phi_vals:
-        for m_val in m_vals:
-            results.append(
-                ScanPoint.from_params(
-                    phi_star,
-                    m_val,
-                    mpl=mpl,
-                    N_range=N_range,
-                    As0=As0,
-                    ns0=ns0,
-                    dAs_frac=dAs_frac,
-                    dns_abs=dns_abs,
-                    r_max=r_max,
-                )
-            )
-    return results
+    target_kwargs = dict(
+        As0=As0,
+        ns0=ns0,
+        dAs_frac=dAs_frac,
+        dns_abs=dns_abs,
+        r_max=r_max,
+    )
+    row_args = (
+        phi_vals,
+        repeat(m_vals),
+        repeat(mpl),
+        repeat(N_range),
+        repeat(target_kwargs),
+    )
+    if n_workers > 1 and n_phi * n_m >= _MIN_PARALLEL_POINTS:
+        chunksize = max(1, n_phi // (4 * n_workers))
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            rows = list(executor.map(_scan_row, *row_args, chunksize=chunksize))
+    else:
+        rows = list(map(_scan_row, *row_args))
+
+    table = ScanTable()
+    for row in rows:
+        table.extend(row)
+    return table
+
+
+def feasibility_boundary(
+    *,
+    phi_range: Tuple[float, float] = PHI_RANGE_DEFAULT,
+    m_range: Tuple[float, float] = M_RANGE_DEFAULT,
+    N_range: Tuple[float, float] = N_RANGE_DEFAULT,
+    n_phi: int = 40,
+    mpl: float = 1.0,
+    As0: float = mvp_model.AS0,
+    ns0: float = mvp_model.NS0,
+    dAs_frac: float = mvp_model.DAS_FRAC,
+    dns_abs: float = mvp_model.DNS_ABS,
+    r_max: float | None = None,
+) -> List[FeasibleBand]:
+    """Locate the valid region's boundary in ``m`` for each ``phi_star``.
+
+    At fixed ``phi_star`` only As depends on ``m`` (As is proportional to
+    m^2), so the valid masses form one interval whose edges follow from the
+    As window in closed form via :func:`mvp_model.m_from_As`. This gives the
+    exact boundary with two evaluations per ``phi_star`` instead of a column
+    of grid points. Rows without valid masses are omitted.
+
+    Rows are screened with the same row constants and N/ns/r checks as
+    :func:`_scan_row`, so both agree on which rows are feasible.
+    """
+
+    target_kwargs = dict(
+        As0=As0,
+        ns0=ns0,
+        dAs_frac=dAs_frac,
+        dns_abs=dns_abs,
+        r_max=r_max,
+    )
+    As_min, As_max, _, _ = mvp_model.target_bounds(
+        As0=As0, ns0=ns0, dAs_frac=dAs_frac, dns_abs=dns_abs
+    )
+
+    bands: List[FeasibleBand] = []
+    for phi_star in _linspace(phi_range[0], phi_range[1], n_phi):
+        ns_val, r_val, N_val, _ = mvp_model.row_constants(phi_star, mpl)
+        if not (
+            mvp_model.N_in_range(N_val, N_range)
+            and mvp_model.accept_row_target(ns_val, r_val, **target_kwargs)
+        ):
+            continue
+
+        m_min = max(m_range[0], mvp_model.m_from_As(As_min, phi_star, mpl))
+        m_max = min(m_range[1], mvp_model.m_from_As(As_max, phi_star, mpl))
+        if m_min <= m_max:
+            bands.append(FeasibleBand(phi_star=phi_star, m_min=m_min, m_max=m_max))
+    return bands
 
 
-def _split_by_validity(points: Iterable[ScanPoint]) -> Tuple[List[ScanPoint], List[ScanPoint]]:
-    valid: List[ScanPoint] = []
-    invalid: List[ScanPoint] = []
-    for point in points:
-        (valid if point.valid else invalid).append(point)
-    return valid, invalid
+def _bounds(values: List[float]) -> Tuple[float, float]:
+    """Return ``(min, max)`` of a scan column."""
+
+    return min(values), max(values)
+
+
+def _map_linear(
+    values: Iterable[float], lo: float, hi: float, axis_lo: float, axis_len: float
+) -> List[float]:
+    """Map ``values`` affinely from [lo, hi] onto [axis_lo, axis_lo + axis_len]."""
+
+    span = hi - lo
+    return [axis_lo + (value - lo) / span * axis_len for value in values]
 
 
 def plot_feasibility(
@@ -156,117 +365,97 @@ def plot_feasibility(
     dns_abs: float = mvp_model.DNS_ABS,
     results_dir: str = "results",
 ) -> Tuple[str, str]:
-    """Create feasibility plots and return the saved file paths (SVG)."""
+    """Create feasibility plots and return the saved file paths (SVG).
 
-    os.makedirs(results_dir, exist_ok=True)
-    valid, invalid = _split_by_validity(points)
+    ``points`` may be a :class:`ScanTable` or any sequence of ``ScanPoint``;
+    the latter is converted to columns first.
+    """
 
-    width, height, pad = 800, 550, 60
+    if not isinstance(points, ScanTable):
+        points = ScanTable.from_points(points)
 
-    def _header(title: str) -> List[str]:
-        return [
-            "<?xml version='1.0' encoding='UTF-8'?>",
-            f"<svg xmlns='http://www.w3.org/2000/svg' width='{width}' height='{height}' aria-label='{title}'>",
-            f"  <title>{title}</title>",
-            "  <style>text{font-family:Arial,sans-serif;font-size:14px}</style>",
-        ]
+    os.makedirs(results_dir, exist_ok=True)
 
-    def _footer() -> List[str]:
-        return ["</svg>"]
+    width, height, pad = _SVG_WIDTH, _SVG_HEIGHT, _SVG_PAD
+    plot_w, plot_h = _SVG_PLOT_W, _SVG_PLOT_H
 
-    def _scatter_elements(
-        xs: List[float], ys: List[float], color: str, label: str
-    ) -> List[str]:
-        elements = [f"  <g fill='{color}' fill-opacity='0.7' stroke='none'>"]
-        for x, y in zip(xs, ys):
-            elements.append(f"    <circle cx='{x:.2f}' cy='{y:.2f}' r='3' />")
-        elements.append("  </g>")
-        elements.append(
-            f"  <text x='{width - pad}' y='{pad - 20 if label== 'valid' else pad}' text-anchor='end' fill='{color}'>■ {label}</text>"
+    # The scatter builders below yield chunks that are streamed straight into
+    # the output file rather than joined into one string.
+    def _marker_block(markers: Iterator[Tuple[float, float]]) -> str:
+        return "".join(
+            _SVG_MARKER % (x - 3.0, y) for x, y in islice(markers, _SVG_MARKER_BLOCK)
         )
-        return elements
 
-    def _axis_labels(x_label: str, y_label: str) -> List[str]:
-        return [
-            f"  <text x='{width/2:.1f}' y='{height - 15}' text-anchor='middle'>{x_label}</text>",
-            f"  <text x='{20}' y='{height/2:.1f}' text-anchor='middle' transform='rotate(-90, 20, {height/2:.1f})'>{y_label}</text>",
-        ]
+    def _scatter_elements(
+        xs: List[float], ys: List[float], mask: List[bool], color: str, label: str
+    ) -> Iterator[str]:
+        # Select the masked points while emitting them, without per-group lists.
+        markers = compress(zip(xs, ys), mask)
+        yield f"  <g fill='{color}' fill-opacity='0.7' stroke='none'>\n"
+        block = _marker_block(markers)
+        if block:
+            # One <path> of markers instead of a <circle> per point.
+            yield "    <path d='"
+            while block:
+                yield block
+                block = _marker_block(markers)
+            yield "' />\n"
+        yield "  </g>\n"
+        yield f"  <text x='{width - pad}' y='{pad - 20 if label== 'valid' else pad}' text-anchor='end' fill='{color}'>■ {label}</text>\n"
 
     # (phi_star, m) feasibility map (log scale for m)
-    phi_min = min(p.phi_star for p in points)
-    phi_max = max(p.phi_star for p in points)
-    log_m_min = math.log10(min(p.m for p in points))
-    log_m_max = math.log10(max(p.m for p in points))
-
-    def _map_phi(phi_val: float) -> float:
-        return pad + (phi_val - phi_min) / (phi_max - phi_min) * (width - 2 * pad)
-
-    def _map_m(m_val: float) -> float:
-        frac = (math.log10(m_val) - log_m_min) / (log_m_max - log_m_min)
-        return height - pad - frac * (height - 2 * pad)
-
-    valid_x = [_map_phi(p.phi_star) for p in valid]
-    valid_y = [_map_m(p.m) for p in valid]
-    invalid_x = [_map_phi(p.phi_star) for p in invalid]
-    invalid_y = [_map_m(p.m) for p in invalid]
-
-    phi_m_lines: List[str] = _header("Feasibility in (phi*, m)")
-    phi_m_lines.append(f"  <rect x='{pad}' y='{pad}' width='{width-2*pad}' height='{height-2*pad}' fill='none' stroke='black' stroke-width='1' />")
-    phi_m_lines.extend(_scatter_elements(invalid_x, invalid_y, "#d62728", "invalid"))
-    phi_m_lines.extend(_scatter_elements(valid_x, valid_y, "#1f77b4", "valid"))
-    phi_m_lines.extend(_axis_labels("phi*", "m (log10)") )
-    phi_m_lines.extend(_footer())
+    phi_min, phi_max = _bounds(points.phi_star)
+    log_m = [math.log10(m_val) for m_val in points.m]
+    log_m_min, log_m_max = _bounds(log_m)
+
+    # Map each column once; the scatter groups select from them by validity.
+    valid_mask = points.valid
+    invalid_mask = [not ok for ok in valid_mask]
+    phi_x = _map_linear(points.phi_star, phi_min, phi_max, pad, plot_w)
+    m_y = _map_linear(log_m, log_m_min, log_m_max, height - pad, -plot_h)
 
     phi_m_path = os.path.join(results_dir, "phase3_feasibility_phi_m.svg")
     with open(phi_m_path, "w", encoding="utf-8") as f:
-        f.write("\n".join(phi_m_lines))
+        f.write(_SVG_HEADER.format(title="Feasibility in (phi*, m)"))
+        f.writelines(_scatter_elements(phi_x, m_y, invalid_mask, "#d62728", "invalid"))
+        f.writelines(_scatter_elements(phi_x, m_y, valid_mask, "#1f77b4", "valid"))
+        f.write(_SVG_AXIS_LABELS.format(x_label="phi*", y_label="m (log10)"))
+        f.write(_SVG_FOOTER)
 
     # (As, ns) scatter with target window (linear scale)
-    ns_min_data = min(p.ns for p in points)
-    ns_max_data = max(p.ns for p in points)
-    As_min_data = min(p.As for p in points)
-    As_max_data = max(p.As for p in points)
+    ns_min_data, ns_max_data = _bounds(points.ns)
+    As_min_data, As_max_data = _bounds(points.As)
 
-    ns_min = min(ns_min_data, ns0 - dns_abs)
-    ns_max = max(ns_max_data, ns0 + dns_abs)
-    As_min = min(As_min_data, As0 * (1.0 - dAs_frac))
-    As_max = max(As_max_data, As0 * (1.0 + dAs_frac))
-
-    def _map_ns(ns_val: float) -> float:
-        return pad + (ns_val - ns_min) / (ns_max - ns_min) * (width - 2 * pad)
-
-    def _map_As(As_val: float) -> float:
-        return height - pad - (As_val - As_min) / (As_max - As_min) * (height - 2 * pad)
+    As_target_min, As_target_max, ns_target_min, ns_target_max = mvp_model.target_bounds(
+        As0=As0, ns0=ns0, dAs_frac=dAs_frac, dns_abs=dns_abs
+    )
 
-    valid_x_ns = [_map_ns(p.ns) for p in valid]
-    valid_y_As = [_map_As(p.As) for p in valid]
-    invalid_x_ns = [_map_ns(p.ns) for p in invalid]
-    invalid_y_As = [_map_As(p.As) for p in invalid]
+    ns_min = min(ns_min_data, ns_target_min)
+    ns_max = max(ns_max_data, ns_target_max)
+    As_min = min(As_min_data, As_target_min)
+    As_max = max(As_max_data, As_target_max)
 
-    As_ns_lines: List[str] = _header("Induced (As, ns) scatter")
-    As_ns_lines.append(f"  <rect x='{pad}' y='{pad}' width='{width-2*pad}' height='{height-2*pad}' fill='none' stroke='black' stroke-width='1' />")
+    ns_x = _map_linear(points.ns, ns_min, ns_max, pad, plot_w)
+    As_y = _map_linear(points.As, As_min, As_max, height - pad, -plot_h)
 
     # Target window rectangle
-    ns_target_min = ns0 - dns_abs
-    ns_target_max = ns0 + dns_abs
-    As_target_min = As0 * (1.0 - dAs_frac)
-    As_target_max = As0 * (1.0 + dAs_frac)
-    rect_x = _map_ns(ns_target_min)
-    rect_y = _map_As(As_target_max)
-    rect_w = _map_ns(ns_target_max) - rect_x
-    rect_h = _map_As(As_target_min) - rect_y
-    As_ns_lines.append(
-        f"  <rect x='{rect_x:.2f}' y='{rect_y:.2f}' width='{rect_w:.2f}' height='{rect_h:.2f}' fill='#999' fill-opacity='0.2' stroke='#666' stroke-dasharray='4,2' />"
+    rect_x, rect_x_end = _map_linear((ns_target_min, ns_target_max), ns_min, ns_max, pad, plot_w)
+    rect_y, rect_y_end = _map_linear(
+        (As_target_max, As_target_min), As_min, As_max, height - pad, -plot_h
     )
-
-    As_ns_lines.extend(_scatter_elements(invalid_x_ns, invalid_y_As, "#d62728", "invalid"))
-    As_ns_lines.extend(_scatter_elements(valid_x_ns, valid_y_As, "#1f77b4", "valid"))
-    As_ns_lines.extend(_axis_labels("ns", "As"))
-    As_ns_lines.extend(_footer())
+    rect_w = rect_x_end - rect_x
+    rect_h = rect_y_end - rect_y
 
     As_ns_path = os.path.join(results_dir, "phase3_scatter_As_ns.svg")
     with open(As_ns_path, "w", encoding="utf-8") as f:
-        f.write("\n".join(As_ns_lines))
+        f.write(_SVG_HEADER.format(title="Induced (As, ns) scatter"))
+        f.write(
+            f"  <rect x='{rect_x:.2f}' y='{rect_y:.2f}' width='{rect_w:.2f}' height='{rect_h:.2f}' fill='#999' fill-opacity='0.2' stroke='#666' stroke-dasharray='4,2' />\n"
+        )
+        f.writelines(_scatter_elements(ns_x, As_y, invalid_mask, "#d62728", "invalid"))
+        f.writelines(_scatter_elements(ns_x, As_y, valid_mask, "#1f77b4", "valid"))
+        f.write(_SVG_AXIS_LABELS.format(x_label="ns", y_label="As"))
+        f.write(_SVG_FOOTER)
 
     return phi_m_path, As_ns_path
 
@@ -285,8 +474,33 @@ def run_phase3_scan(
     dns_abs: float = mvp_model.DNS_ABS,
     r_max: float | None = None,
     results_dir: str = "results",
-) -> Tuple[List[ScanPoint], Tuple[str, str]]:
-    """Convenience wrapper that performs the scan and plots the results."""
+    n_workers: int = 1,
+    mode: str = "grid",
+) -> Tuple[Union[ScanTable, List[FeasibleBand]], Tuple[str, ...]]:
+    """Convenience wrapper that performs the scan and plots the results.
+
+    ``mode="grid"`` (default) runs :func:`coarse_grid` and saves the plots.
+    ``mode="adaptive"`` returns only the boundary curves from
+    :func:`feasibility_boundary`, using ``n_phi`` rows and ignoring ``n_m``.
+    No plots are written in that mode, so the returned path tuple is empty.
+    """
+
+    if mode == "adaptive":
+        bands = feasibility_boundary(
+            phi_range=phi_range,
+            m_range=m_range,
+            N_range=N_range,
+            n_phi=n_phi,
+            mpl=mpl,
+            As0=As0,
+            ns0=ns0,
+            dAs_frac=dAs_frac,
+            dns_abs=dns_abs,
+            r_max=r_max,
+        )
+        return bands, ()
+    if mode != "grid":
+        raise ValueError(f"unknown scan mode {mode!r}; expected 'grid' or 'adaptive'")
 
     points = coarse_grid(
         phi_range=phi_range,
@@ -300,6 +514,7 @@ def run_phase3_scan(
         dAs_frac=dAs_frac,
         dns_abs=dns_abs,
         r_max=r_max,
+        n_workers=n_workers,
     )
     paths = plot_feasibility(
         points,
@@ -314,7 +529,7 @@ def run_phase3_scan(
 
 if __name__ == "__main__":
     points, paths = run_phase3_scan()
-    valid_count = sum(1 for p in points if p.valid)
+    valid_count = sum(points.valid)
     total = len(points)
     print(f"Generated {total} grid points; {valid_count} are valid.")
     print("Saved plots:")